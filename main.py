@@ -1,9 +1,25 @@
-import argparse
 import math
-import random
 import sys
 import bpy
-from mathutils import Vector
+import numpy as np
+
+# Optional dependency, imported by _get_transforms_kernel only when the kernel is needed
+numba = None
+
+# World up axis the camera basis is built against
+_WORLD_UP = np.array((0.0, 0.0, 1.0))
+# Default camera orientation: looking down its local -Z axis
+_DEFAULT_FORWARD = np.array((0.0, 0.0, -1.0))
+
+# Unit-circle cosines/sines of the camera angles, keyed by number of cameras
+_TRIG_CACHE = {}
+
+# Camera count from which the Numba kernel is used. The script runs once per Blender
+# process, so JIT compilation (~0.3 s cached, ~1 s cold) is never amortized, while
+# the NumPy path takes ~0.4 ms for 256 cameras and ~2.3 ms for 10^4.
+_NUMBA_MIN_CAMERAS = 100_000
+# Compiled Numba kernel, built on first use by _get_transforms_kernel
+_TRANSFORMS_KERNEL = None
 
 
 def parse_arguments(args):
@@ -20,6 +36,9 @@ def parse_arguments(args):
     argparse.Namespace
         Parsed arguments namespace.
     """
+    # Deferred until main runs instead of being paid when the module is imported
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Generate a series of cameras and lights in a Blender scene."
     )
@@ -82,17 +101,28 @@ def parse_arguments(args):
         "--clean_scene", action='store_true',
         help="Remove existing cameras and lights before adding new ones."
     )
+    parser.add_argument(
+        "--seed", type=int,
+        help="Seed for the random height variation (default: random)."
+    )
 
-    return parser.parse_known_args(args)
+    parsed_args, unknown_args = parser.parse_known_args(args)
+    if parsed_args.num_cameras < 0:
+        parser.error("--num_cameras must be a non-negative integer.")
+
+    return parsed_args, unknown_args
 
 
 def clean_scene():
     """
     Remove all existing cameras and lights from the current Blender scene.
     """
-    for obj in bpy.context.scene.objects:
-        if obj.type == 'CAMERA' or obj.type == 'LIGHT':
-            bpy.data.objects.remove(obj, do_unlink=True)
+    targets = [obj for obj in bpy.context.scene.objects if obj.type in {'CAMERA', 'LIGHT'}]
+    target_data = {obj.data for obj in targets}
+    bpy.data.batch_remove(ids=targets)
+
+    # Drop the camera/light data-blocks left without users so they don't pile up across runs
+    bpy.data.batch_remove(ids=[data for data in target_data if data.users == 0])
 
 
 def get_vertex_world_coordinate(obj_name, vertex_index):
@@ -130,6 +160,48 @@ def get_vertex_world_coordinate(obj_name, vertex_index):
     return obj.matrix_world @ mesh.vertices[vertex_index].co
 
 
+def get_vertex_world_coordinates(obj_name, indices):
+    """
+    Get the world coordinates of several vertices from a given object at once.
+
+    Parameters
+    ----------
+    obj_name : str
+        The name of the object.
+    indices : numpy.ndarray
+        Indices of the vertices.
+
+    Returns
+    -------
+    numpy.ndarray
+        World coordinates of the specified vertices, of shape (len(indices), 3).
+
+    Raises
+    ------
+    ValueError
+        If the object or a vertex isn't found or is not a mesh.
+    """
+    obj = bpy.data.objects.get(obj_name)
+    if not obj:
+        raise ValueError(f"Object '{obj_name}' not found.")
+
+    if obj.type != 'MESH':
+        raise ValueError(f"Object '{obj_name}' is not a mesh.")
+
+    mesh = obj.data
+    indices = np.asarray(indices, dtype=np.int64)
+    if np.any((indices < 0) | (indices >= len(mesh.vertices))):
+        raise ValueError(f"Vertex indices out of range for object '{obj_name}'.")
+
+    # Bulk-copy all local coordinates, then transform the requested ones in one matmul
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get('co', co)
+    co = co.reshape(-1, 3)[indices]
+    homogeneous = np.hstack([co, np.ones((len(co), 1))])
+
+    return (np.array(obj.matrix_world) @ homogeneous.T).T[:, :3]
+
+
 def get_selected_vertex_world_coordinate():
     """
     Get the world coordinates of the first selected vertex on the active mesh object.
@@ -153,11 +225,14 @@ def get_selected_vertex_world_coordinate():
     if not active_obj or active_obj.type != 'MESH':
         raise TypeError("Active object is not a mesh or no active object found.")
 
-    selected_vertices = [v for v in active_obj.data.vertices if v.select]
-    if not selected_vertices:
+    # Bulk-copy the selection flags instead of visiting each vertex from Python
+    vertices = active_obj.data.vertices
+    selected = np.zeros(len(vertices), dtype=bool)
+    vertices.foreach_get('select', selected)
+    if not selected.any():
         raise ValueError("No vertices are selected. Please select a vertex on the object.")
 
-    return active_obj.matrix_world @ selected_vertices[0].co
+    return active_obj.matrix_world @ vertices[int(np.argmax(selected))].co
 
 
 def determine_look_at_point(args):
@@ -196,55 +271,287 @@ def determine_look_at_point(args):
             pass
 
     # Default to specified coordinates
+    from mathutils import Vector
     return Vector((args.look_at_x, args.look_at_y, args.look_at_z))
 
 
-def add_camera_and_light(index, angle, radius, base_height, height_variation, look_at, light_energy, light_offset):
+def get_unit_circle(num_cameras):
+    """
+    Get the cosines and sines of evenly spaced camera angles around the circle.
+
+    Results are cached per number of cameras and are independent of the radius,
+    so repeated runs in the same Blender session skip the trigonometry.
+
+    Parameters
+    ----------
+    num_cameras : int
+        Number of cameras to place.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Read-only cosines and sines of the camera angles, both of shape (num_cameras,).
+    """
+    if num_cameras not in _TRIG_CACHE:
+        angles = np.linspace(0.0, 2.0 * np.pi, num_cameras, endpoint=False, dtype=np.float64)
+        cos_table = np.cos(angles)
+        sin_table = np.sin(angles)
+        cos_table.flags.writeable = False
+        sin_table.flags.writeable = False
+        _TRIG_CACHE[num_cameras] = (cos_table, sin_table)
+    return _TRIG_CACHE[num_cameras]
+
+
+def compute_camera_placements(num_cameras, radius, base_height, height_offsets, look_at_xyz):
     """
-    Add a single camera and corresponding light into the scene.
+    Compute the positions and viewing directions of all cameras at once.
 
     Parameters
     ----------
-    index : int
-        The camera index (for naming).
-    angle : float
-        The angle around the circle where the camera is placed.
+    num_cameras : int
+        Number of cameras to place.
     radius : float
-        The radius from the center point where the camera is placed.
+        The radius from the center point where the cameras are placed.
     base_height : float
-        Base height for the camera.
+        Base height for the cameras.
+    height_offsets : numpy.ndarray
+        Additional height of each camera above the base height, of shape (num_cameras,).
+    look_at_xyz : sequence of float
+        The point in 3D space the cameras should look at.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Camera locations and unit directions towards the look-at point, both of shape (num_cameras, 3).
+    """
+    cos_table, sin_table = get_unit_circle(num_cameras)
+    xs = radius * cos_table
+    ys = radius * sin_table
+    zs = base_height + height_offsets
+    locations = np.stack([xs, ys, zs], axis=1)
+
+    directions = np.asarray(look_at_xyz, dtype=np.float64) - locations
+    norms = np.linalg.norm(directions, axis=1, keepdims=True)
+    # A camera sitting on the look-at point keeps a zero direction
+    norms[norms == 0] = 1.0
+    directions /= norms
+
+    return locations, directions
+
+
+def compute_look_at_rotations(directions):
+    """
+    Compute camera Euler rotations that point each camera along its direction.
+
+    Equivalent to ``direction.to_track_quat('-Z', 'Y').to_euler()`` for every row,
+    evaluated for all cameras at once.
+
+    Parameters
+    ----------
+    directions : numpy.ndarray
+        Unit directions the cameras look along, of shape (N, 3).
+
+    Returns
+    -------
+    numpy.ndarray
+        XYZ Euler angles of shape (N, 3).
+    """
+    # Cameras without a direction keep the default orientation (looking down -Z)
+    forward = np.where(np.any(directions, axis=1, keepdims=True), directions, _DEFAULT_FORWARD)
+
+    # Camera basis: -Z along forward, Y towards world up, X to the right
+    right = np.cross(forward, _WORLD_UP)
+    right_norms = np.linalg.norm(right, axis=1, keepdims=True)
+    vertical = right_norms[:, 0] < 1e-6
+    right[vertical] = (1.0, 0.0, 0.0)
+    right_norms[vertical] = 1.0
+    right /= right_norms
+    up = np.cross(right, forward)
+    rot = np.stack([right, up, -forward], axis=2)
+
+    # XYZ Euler read straight from the matrix (R = Rz @ Ry @ Rx, Blender's default
+    # order). Right is always horizontal, so cy never vanishes (no gimbal lock).
+    cy = np.hypot(rot[:, 0, 0], rot[:, 1, 0])
+    ex = np.arctan2(rot[:, 2, 1], rot[:, 2, 2])
+    ey = np.arctan2(-rot[:, 2, 0], cy)
+    ez = np.arctan2(rot[:, 1, 0], rot[:, 0, 0])
+
+    return np.stack([ex, ey, ez], axis=1)
+
+
+def _compute_transforms_kernel(cos_table, sin_table, radius, base_height, height_offsets, look_at_xyz):
+    # Numba kernel behind compute_transforms; compiled on first use by _get_transforms_kernel
+    num_cameras = len(cos_table)
+    locations = np.empty((num_cameras, 3))
+    rotations = np.empty((num_cameras, 3))
+
+    for i in numba.prange(num_cameras):
+        x = radius * cos_table[i]
+        y = radius * sin_table[i]
+        z = base_height + height_offsets[i]
+        locations[i, 0] = x
+        locations[i, 1] = y
+        locations[i, 2] = z
+
+        dx = look_at_xyz[0] - x
+        dy = look_at_xyz[1] - y
+        dz = look_at_xyz[2] - z
+        length = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if length > 0.0:
+            fx = dx / length
+            fy = dy / length
+            fz = dz / length
+        else:
+            fx = 0.0
+            fy = 0.0
+            fz = -1.0
+
+        # Camera basis, see compute_look_at_rotations
+        rx = fy
+        ry = -fx
+        right_length = math.sqrt(rx * rx + ry * ry)
+        if right_length < 1e-6:
+            rx = 1.0
+            ry = 0.0
+        else:
+            rx /= right_length
+            ry /= right_length
+        uz = rx * fy - ry * fx
+
+        # XYZ Euler from the matrix [right, up, -forward]. Right is unit length
+        # with no z component, so the Y angle atan2(-right.z, |right.xy|) is zero
+        rotations[i, 0] = math.atan2(uz, -fz)
+        rotations[i, 1] = 0.0
+        rotations[i, 2] = math.atan2(ry, rx)
+
+    return locations, rotations
+
+
+def _get_transforms_kernel():
+    """
+    Import Numba and JIT-compile the transforms kernel on first use.
+
+    Returns
+    -------
+    callable or None
+        The compiled kernel, or None if Numba is not installed.
+    """
+    global numba, _TRANSFORMS_KERNEL
+    if _TRANSFORMS_KERNEL is None:
+        try:
+            import numba
+        except ImportError:
+            return None
+
+        try:
+            _TRANSFORMS_KERNEL = numba.njit(parallel=True, cache=True)(_compute_transforms_kernel)
+        except RuntimeError:
+            # Caching needs a source file on disk, which code run from Blender's Text
+            # Editor (e.g. '/path/scene.blend/main.py') does not have
+            _TRANSFORMS_KERNEL = numba.njit(parallel=True)(_compute_transforms_kernel)
+    return _TRANSFORMS_KERNEL
+
+
+def compute_transforms(num_cameras, radius, base_height, height_variation, look_at_xyz, seed=None):
+    """
+    Compute camera locations and rotations.
+
+    Uses the vectorized NumPy implementation, or a parallel Numba kernel for very
+    large camera counts (_NUMBA_MIN_CAMERAS or more) when Numba is installed. The
+    random heights are drawn once up front, so both produce the same cameras for
+    the same seed.
+
+    Parameters
+    ----------
+    num_cameras : int
+        Number of cameras to place.
+    radius : float
+        The radius from the center point where the cameras are placed.
+    base_height : float
+        Base height for the cameras.
     height_variation : float
-        Maximum random additional height to add to the camera's position.
-    look_at : Vector
-        The point in 3D space the camera should look at.
-    light_energy : float
-        The intensity (energy) of the point light.
-    light_offset : float
-        The distance in front of the camera where the light is placed.
+        Maximum random additional height to add to each camera's position.
+    look_at_xyz : sequence of float
+        The point in 3D space the cameras should look at.
+    seed : int, optional
+        Seed for the random height variation.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Camera locations and XYZ Euler rotations, both of shape (num_cameras, 3).
     """
-    # Calculate camera position
-    x = radius * math.cos(angle)
-    y = radius * math.sin(angle)
-    z = base_height + random.uniform(0, height_variation)
+    height_offsets = np.random.default_rng(seed).uniform(0, height_variation, num_cameras)
 
-    # Add camera
-    bpy.ops.object.camera_add(location=(x, y, z))
-    cam = bpy.context.active_object
-    cam.name = f"Camera_{index}"
+    kernel = _get_transforms_kernel() if num_cameras >= _NUMBA_MIN_CAMERAS else None
+    if kernel is None:
+        locations, directions = compute_camera_placements(
+            num_cameras, radius, base_height, height_offsets, look_at_xyz
+        )
+        return locations, compute_look_at_rotations(directions)
 
-    # Orient camera towards the target point
-    direction = look_at - cam.location
-    cam.rotation_euler = direction.to_track_quat('-Z', 'Y').to_euler()
+    cos_table, sin_table = get_unit_circle(num_cameras)
+    return kernel(
+        cos_table, sin_table, float(radius), float(base_height), height_offsets,
+        np.asarray(look_at_xyz, dtype=np.float64)
+    )
 
-    # Add a point light at the camera location
-    bpy.ops.object.light_add(type='POINT', location=(x, y, z))
-    light = bpy.context.active_object
-    light.name = f"Light_{index}"
-    light.data.energy = light_energy
-    light.parent = cam
 
-    # Offset the light in front of the camera
-    light.location = cam.location + cam.matrix_world.to_quaternion() @ Vector((0, 0, light_offset))
+def create_cameras_and_lights(collection, locations, rotations, light_offset, light_energy):
+    """
+    Create the cameras and their point lights from precomputed transforms.
+
+    Parameters
+    ----------
+    collection : bpy.types.Collection
+        The collection the new objects are linked into.
+    locations : numpy.ndarray
+        Camera positions, float64 of shape (N, 3).
+    rotations : numpy.ndarray
+        Camera XYZ Euler rotations, float64 of shape (N, 3).
+    light_offset : float
+        The distance in front of each camera where its light is placed.
+    light_energy : float
+        The intensity (energy) of the point lights.
+
+    Returns
+    -------
+    list of bpy.types.Object
+        The created camera objects.
+    """
+    # Data API instead of operators, which would trigger a scene update per call.
+    # Constructors and the link method are bound to locals once.
+    new_camera = bpy.data.cameras.new
+    new_light = bpy.data.lights.new
+    new_object = bpy.data.objects.new
+    coll_link = collection.objects.link
+
+    # Lights sit in front of their camera in camera space (cameras look down their
+    # local -Z axis), so every light shares the same local offset
+    light_location = (0.0, 0.0, -light_offset)
+
+    cameras = []
+    # Plain float lists convert to RNA vectors faster than NumPy rows
+    placements = zip(locations.tolist(), rotations.tolist())
+    for index, (location, rotation) in enumerate(placements, start=1):
+        cam_name = f"Camera_{index}"
+        cam = new_object(cam_name, new_camera(cam_name))
+        coll_link(cam)
+        cam.location = location
+        cam.rotation_euler = rotation
+
+        # Add a point light parented to the camera
+        light_name = f"Light_{index}"
+        light_data = new_light(light_name, type='POINT')
+        light_data.energy = light_energy
+        light = new_object(light_name, light_data)
+        coll_link(light)
+        light.parent = cam
+        light.location = light_location
+
+        cameras.append(cam)
+
+    return cameras
 
 
 def main(args):
@@ -262,24 +569,41 @@ def main(args):
     light_energy = parsed_args.light_energy
     light_offset = parsed_args.light_offset
     clean = parsed_args.clean_scene
+    seed = parsed_args.seed
 
     # Clean up existing cameras/lights if requested
     if clean:
         clean_scene()
 
+    # Precompute all placements, then only create the objects in the loop
+    locations, rotations = compute_transforms(
+        num_cameras=num_cameras,
+        radius=radius,
+        base_height=base_height,
+        height_variation=height_variation,
+        look_at_xyz=tuple(look_at),
+        seed=seed
+    )
+
+    # Resolve the scene and view layer up front. Nothing from here to the final
+    # update reads evaluated data (matrix_world, evaluated_depsgraph_get, ...), so
+    # the depsgraph is only tagged while building and evaluated once at the end.
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+
     # Add specified number of cameras
-    for i in range(num_cameras):
-        angle = i * (2 * math.pi / num_cameras)
-        add_camera_and_light(
-            index=i+1,
-            angle=angle,
-            radius=radius,
-            base_height=base_height,
-            height_variation=height_variation,
-            look_at=look_at,
-            light_energy=light_energy,
-            light_offset=light_offset
-        )
+    cameras = create_cameras_and_lights(
+        collection=scene.collection,
+        locations=locations,
+        rotations=rotations,
+        light_offset=light_offset,
+        light_energy=light_energy
+    )
+
+    # Make the last camera active, once, and evaluate the scene for all new objects
+    if cameras:
+        view_layer.objects.active = cameras[-1]
+    view_layer.update()
 
 
 if __name__ == "__main__":